@@ -27,7 +27,10 @@ component_versions = eks.ComponentVersions(**versions_data)
 
 # Node pools configuration
 node_pools_data = config.require_object("node_pools")
-node_pools = [eks.NodePoolConfig.from_dict(pool) for pool in node_pools_data]
+node_pools = eks.parse_node_pools(node_pools_data)
+
+# Addon types are shared by every region, build the list once
+_RECOMMENDED_ADDONS = eks_addons.recommended_addons()
 
 # ------------------------------------------------------------------------------
 # Networking Resources
@@ -44,17 +47,21 @@ vpc_network = vpc.VPCPeeredGroup(
 # ------------------------------------------------------------------------------
 def create_cluster_and_addons(
     region_name: str,
+    addon_types: list[type[eks.cluster.EKSClusterAddon]] = _RECOMMENDED_ADDONS,
 ) -> tuple[eks.EKSCluster, eks.EKSClusterAddonInstaller]:
     """
     Creates an EKS cluster and installs addons for the specified region.
     
     Uses global configuration for networking, node pools, and versions.
     """
+    region_prefix = f"{deployment_name}-{region_name}"
+    region_vpc = vpc_network.vpcs[region_name]
+
     # Create the EKS Cluster
     cluster_resource = eks.EKSCluster(
-        f"{deployment_name}-{region_name}-cls",
-        vpc_id=vpc_network.vpcs[region_name].vpc_id,
-        subnet_ids=vpc_network.vpcs[region_name].private_subnet_ids,
+        f"{region_prefix}-cls",
+        vpc_id=region_vpc.vpc_id,
+        subnet_ids=region_vpc.private_subnet_ids,
         node_pools=node_pools,
         region=region_name,
         versions=component_versions,
@@ -62,15 +69,17 @@ def create_cluster_and_addons(
 
     # Install recommended addons
     addon_installer = eks.EKSClusterAddonInstaller(
-        f"{deployment_name}-{region_name}-addons",
+        f"{region_prefix}-addons",
         cluster=cluster_resource,
-        addon_types=eks_addons.recommended_addons(),
+        addon_types=addon_types,
         versions=component_versions,
     )
 
     return cluster_resource, addon_installer
 
-# Deploy clusters across all configured regions
+# Deploy clusters across all configured regions.
+# Constructors only queue resource registrations, the Pulumi engine then
+# provisions every region concurrently, so a plain loop is enough here.
 clusters_with_addons = {
     region: create_cluster_and_addons(region)
     for region in regions
@@ -2,42 +2,81 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+
 import pulumi
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from pulumi_eks_ml import eks
 
 
-class SkyPilotConfig(BaseModel):
+# Parsed once per program run and only read afterwards.
+_STRICT = ConfigDict(frozen=True, extra="forbid")
+
+
+class DataPlaneConfig(BaseModel):
+    model_config = _STRICT
+
+    name: str
+    user_role_arn: str | None = None
+
+
+class SkyPilotDataPlanesConfig(BaseModel):
+    model_config = _STRICT
+
+    data_planes: list[DataPlaneConfig] = Field(default_factory=list)
+    # Spokes reuse the hub's `skypilot` section, so its API server keys are
+    # accepted by name and ignored, they are only required on the hub.
+    ingress_host: str | None = None
+    ingress_ssl_cert_arn: str | None = None
+    default_user_role: str | None = None
+
+
+class SkyPilotConfig(SkyPilotDataPlanesConfig):
     ingress_host: str
     ingress_ssl_cert_arn: str
     default_user_role: str
-    data_planes: list[DataPlaneConfig] = Field(default_factory=list)
 
-class TailscaleConfig(BaseModel):
-    oauth_secret_arn: str
 
+class TailscaleConfig(BaseModel):
+    model_config = _STRICT
 
-class DataPlaneConfig(BaseModel):
-    name: str
-    user_role_arn: str | None = None
+    oauth_secret_arn: str
 
 
 class RegionConfig(BaseModel):
-    region: str
-    node_pools: list[dict]
+    model_config = _STRICT
 
-    @property
-    def eks_node_pools(self) -> list[eks.NodePoolConfig]:
-        return [eks.NodePoolConfig.from_dict(p) for p in self.node_pools]
+    region: str
+    node_pools: list[eks.NodePoolConfig]
+    skypilot: SkyPilotDataPlanesConfig = Field(default_factory=SkyPilotDataPlanesConfig)
+    # Spokes share the hub's schema in stack configs, so the hub-only section
+    # is accepted (and ignored) by name while any other unknown key is an error.
+    tailscale: TailscaleConfig | None = None
+
+    @field_validator("node_pools", mode="before")
+    @classmethod
+    def parse_node_pools(cls, value: list) -> list:
+        # Re-raised as ValueError so pydantic reports it with the field location
+        try:
+            return [
+                eks.NodePoolConfig.from_dict(p) if isinstance(p, dict) else p
+                for p in value
+            ]
+        except (TypeError, KeyError) as e:
+            raise ValueError(f"Invalid node pool: {e}") from e
 
 
 class HubConfig(RegionConfig):
+    model_config = _STRICT
+
     skypilot: SkyPilotConfig
     tailscale: TailscaleConfig
 
 
 class ProjectConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     hub: HubConfig
     spokes: list[RegionConfig] = Field(default_factory=list)
     component_versions: dict = Field(default_factory=dict, alias="versions")
@@ -55,6 +94,16 @@ class ProjectConfig(BaseModel):
             )
         return self
 
+    @cached_property
+    def all_region_configs(self) -> tuple[RegionConfig, ...]:
+        """The hub + spokes region configs in order."""
+        return (self.hub, *self.spokes)
+
+    @cached_property
+    def all_regions(self) -> tuple[str, ...]:
+        """The hub + spokes regions in order."""
+        return tuple(rc.region for rc in self.all_region_configs)
+
 
 def load_project_config(pulumi_config: pulumi.Config) -> ProjectConfig:
     """Load and validate project configuration."""
@@ -63,8 +112,3 @@ def load_project_config(pulumi_config: pulumi.Config) -> ProjectConfig:
         spokes=pulumi_config.get_object("spokes") or [],
         component_versions=pulumi_config.get_object("component_versions") or {},
     )
-
-
-def get_all_regions(config: ProjectConfig) -> list[str]:
-    """Return the hub + spokes regions in order."""
-    return [config.hub.region] + [s.region for s in config.spokes]
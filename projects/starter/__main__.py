@@ -10,7 +10,7 @@ cfg = pulumi.Config()
 deployment_name = f"{pulumi.get_project()}-{pulumi.get_stack()}"
 node_pools_config = cfg.require_object("node_pools")
 
-node_pools = [eks.NodePoolConfig.from_dict(pool) for pool in node_pools_config]
+node_pools = eks.parse_node_pools(node_pools_config)
 
 vpc_resource = vpc.VPC(
     name=f"{deployment_name}-vpc",
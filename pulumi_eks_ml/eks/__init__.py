@@ -1,10 +1,15 @@
 """EKS cluster components."""
 
-from .cluster import EKSCluster, EKSClusterAddonInstaller
-from .irsa import IRSA
-from .config import NodePoolConfig, TaintConfig, ComponentVersions
+import importlib
+import typing
+
+from .config import NodePoolConfig, TaintConfig, ComponentVersions, parse_node_pools
 from . import config
 
+if typing.TYPE_CHECKING:
+    from .cluster import EKSCluster, EKSClusterAddonInstaller
+    from .irsa import IRSA
+
 __all__ = [
     "EKSCluster",
     "EKSClusterAddonInstaller",
@@ -12,5 +17,31 @@ __all__ = [
     "NodePoolConfig",
     "TaintConfig",
     "ComponentVersions",
+    "parse_node_pools",
     "config",
 ]
+
+# The Pulumi components pull in the AWS/Kubernetes provider SDKs, so they are
+# only imported on first access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "EKSCluster": ".cluster",
+    "EKSClusterAddonInstaller": ".cluster",
+    "IRSA": ".irsa",
+}
+_LAZY_SUBMODULES = {"caller_identity", "cluster", "irsa", "karpenter"}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_LAZY_SUBMODULES})
@@ -0,0 +1,36 @@
+"""Memoized AWS caller identity lookups shared by the EKS components."""
+
+import functools
+import weakref
+
+import pulumi
+import pulumi_aws as aws
+
+_ACCOUNT_IDS: "weakref.WeakKeyDictionary[pulumi.ProviderResource, str]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@functools.cache
+def _default_account_id() -> str:
+    """Get the AWS account ID of the default provider's credentials."""
+    return aws.get_caller_identity().account_id
+
+
+def get_account_id(provider: pulumi.ProviderResource | None) -> str:
+    """Get the AWS account ID of the provider's credentials.
+
+    The getCallerIdentity invoke is blocking, so it only runs once per provider
+    and later calls (cluster, Karpenter, SkyPilot, ...) reuse the result.
+    ``None`` means the default provider, which cannot be a weak key and is
+    memoized separately.
+    """
+    if provider is None:
+        return _default_account_id()
+    account_id = _ACCOUNT_IDS.get(provider)
+    if account_id is None:
+        account_id = aws.get_caller_identity(
+            opts=pulumi.InvokeOptions(provider=provider)
+        ).account_id
+        _ACCOUNT_IDS[provider] = account_id
+    return account_id
@@ -13,6 +13,7 @@ import pulumi_eks as eks
 import pulumi_kubernetes as k8s
 
 from . import config
+from .caller_identity import get_account_id
 from .karpenter import KarpenterAddon
 
 
@@ -61,6 +62,9 @@ class EKSCluster(pulumi.ComponentResource):
 
         # Create EKS cluster
         self.k8s = self._create_eks_cluster()
+        # Bound once so Karpenter and every addon IRSA share the same Outputs
+        self.oidc_provider_arn = self.k8s.oidc_provider_arn
+        self.oidc_issuer = self.k8s.oidc_issuer
         self.k8s_fargate_profile = self._create_fargate_profile()
         # Bootstrap CoreDNS after Fargate profile is ready
         self.coredns_addon = self._create_coredns_addon()
@@ -88,8 +92,6 @@ class EKSCluster(pulumi.ComponentResource):
         self.cluster_security_group_id = self.k8s.cluster_security_group_id
         self.node_security_group_id = self.node_security_group.id
         self.kubeconfig = self.k8s.kubeconfig_json
-        self.oidc_provider_arn = self.k8s.oidc_provider_arn
-        self.oidc_issuer = self.k8s.oidc_issuer
         self.fargate_profile_id = self.k8s.fargate_profile_id
         self.cluster_arn = self.k8s.eks_cluster.apply(lambda cluster: cluster.arn)
 
@@ -112,6 +114,11 @@ class EKSCluster(pulumi.ComponentResource):
     def aws_provider(self) -> aws.Provider:
         return self._aws_provider
 
+    @property
+    def account_id(self) -> str:
+        """AWS account ID of the cluster's provider, looked up once per provider."""
+        return get_account_id(self._aws_provider)
+
     @property
     def k8s_provider(self) -> k8s.Provider:
         if self._k8s_provider:
@@ -169,7 +176,7 @@ class EKSCluster(pulumi.ComponentResource):
         """Create the Fargate profile with pod execution role."""
         # Get AWS account ID and region for the trust policy
         invoke_opts = pulumi.InvokeOptions(provider=self.aws_provider)
-        account_id = aws.get_caller_identity(opts=invoke_opts).account_id
+        account_id = self.account_id
         region = aws.get_region(opts=invoke_opts).region
 
         # Create a pod execution role for Fargate
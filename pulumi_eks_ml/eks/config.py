@@ -1,7 +1,8 @@
 """Configuration constants and data classes for EKS components."""
 
+import functools
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 
 # EFS CSI Driver constants
@@ -32,22 +33,22 @@ DEFAULT_VCPU_LIMIT = "100"
 DEFAULT_MEMORY_LIMIT = "100Gi"
 
 # AWS managed policies for EKS nodes
-EKS_NODE_POLICIES = [
+EKS_NODE_POLICIES = (
     "arn:aws:iam::aws:policy/AmazonEKSWorkerNodePolicy",
     "arn:aws:iam::aws:policy/AmazonEKS_CNI_Policy",
     "arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly",
-    "arn:aws:iam::aws:policy/AmazonElasticFileSystemClientFullAccess"
-]
+    "arn:aws:iam::aws:policy/AmazonElasticFileSystemClientFullAccess",
+)
 
 # Security group ports and protocols
-CLUSTER_FROM_NODE_SG_RULES = [
+CLUSTER_FROM_NODE_SG_RULES = (
     (443, "tcp", "Kubernetes API accessible from node SG"),
     (53, "udp", "CoreDNS accessible from node SG"),
     (53, "tcp", "CoreDNS accessible from node SG"),
     (10250, "tcp", "Kubelet on Fargate nodes accessible from node SG"),
     (9153, "tcp", "Prometheus metrics from Fargate nodes"),
     (8085, "tcp", "Metrics for Karpenter"),
-]
+)
 
 # Fargate selectors for system components
 FARGATE_KARPENTER_COREDNS_SELECTORS = [
@@ -64,22 +65,38 @@ FARGATE_KARPENTER_COREDNS_SELECTORS = [
 ]
 
 # EKS cluster log types
-CLUSTER_LOG_TYPES = [
+CLUSTER_LOG_TYPES = (
     "api",
     "audit",
     "authenticator",
     "controllerManager",
     "scheduler",
-]
+)
 
+# First letters of GPU instance types/families/categories (g5, p4d, ...)
+_GPU_PREFIXES = frozenset({"g", "p"})
 
-@dataclass
+TaintEffect = typing.Literal["NoSchedule", "PreferNoSchedule", "NoExecute"]
+CapacityType = typing.Literal["spot", "on-demand"]
+Architecture = typing.Literal["amd64", "arm64"]
+
+
+def _assert_literal(field_name: str, value: object, literal: typing.Any) -> None:
+    allowed = typing.get_args(literal)
+    if value not in allowed:
+        raise ValueError(f"Invalid {field_name} '{value}', expected one of {allowed}")
+
+
+@dataclass(slots=True)
 class TaintConfig:
     """Configuration for a Kubernetes taint."""
 
     key: str
     value: str | None = None
-    effect: typing.Literal["NoSchedule", "PreferNoSchedule", "NoExecute"] = "NoSchedule"
+    effect: TaintEffect = "NoSchedule"
+
+    def __post_init__(self):
+        _assert_literal("taint effect", self.effect, TaintEffect)
 
     def to_toleration(
         self, operator: typing.Literal["Equal", "Exists"] = "Equal"
@@ -89,41 +106,86 @@ class TaintConfig:
         Args:
             operator: Toleration operator. "Equal" matches key and value, "Exists" matches only key.
         """
-        toleration = {"key": self.key, "operator": operator, "effect": self.effect}
         if operator == "Equal" and self.value:
-            toleration["value"] = self.value
-        return toleration
+            return {
+                "key": self.key,
+                "operator": operator,
+                "effect": self.effect,
+                "value": self.value,
+            }
+        return {"key": self.key, "operator": operator, "effect": self.effect}
+
+
+def _as_tuple(strings: list[str] | None) -> tuple[str, ...] | None:
+    return None if strings is None else tuple(strings)
+
+
+def _assert_all_gpu_or_none(strings: typing.Sequence[str] | None) -> None:
+    if not strings:
+        return
+    prefixes = {s[:1] for s in strings}
+    if prefixes & _GPU_PREFIXES and prefixes - _GPU_PREFIXES:
+        raise ValueError(
+            f"Mixing GPU and non-GPU specification for '{strings=}' is not allowed"
+        )
 
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _classify_instance_specs(
+    instance_type: tuple[str, ...] | None,
+    instance_family: tuple[str, ...] | None,
+    instance_category: tuple[str, ...] | None,
+) -> bool:
+    """Validate that the instance specs select either only GPU or only non-GPU
+    instances, and return whether they are GPU.
+
+    Node pools are usually repeated across regions with the same specs, so the
+    result is memoized on the (immutable) spec tuples. NodePoolConfig instances
+    themselves are mutable and never shared.
+    """
+    _assert_all_gpu_or_none(instance_type)
+    _assert_all_gpu_or_none(instance_family)
+    _assert_all_gpu_or_none(instance_category)
+
+    instance_specs = [
+        *(instance_type or ()),
+        *(instance_family or ()),
+        *(instance_category or ()),
+    ]
+
+    try:
+        _assert_all_gpu_or_none(instance_specs)
+    except ValueError as e:
+        e.add_note(
+            "The mixing of instance type/family/category specifications is incorrect and yields a set of GPU and non-GPU instances, this is not allowed."
+        )
+        raise e
+
+    return all(s[:1] in _GPU_PREFIXES for s in instance_specs)
+
+
+@dataclass(slots=True)
 class NodePoolConfig:
     """Configuration for a Karpenter node pool."""
 
     name: str
-    capacity_type: typing.Literal["spot", "on-demand"]
+    capacity_type: CapacityType
     instance_type: list[str] | None = None
     instance_family: list[str] | None = None
     instance_category: list[str] | None = None
     ebs_size: str = DEFAULT_EBS_SIZE
     vcpu_limit: str = DEFAULT_VCPU_LIMIT
     memory_limit: str = DEFAULT_MEMORY_LIMIT
-    architecture: typing.Literal["amd64", "arm64"] | None = "amd64"
+    architecture: Architecture | None = "amd64"
     # Custom taints and labels
     taints: list[TaintConfig] | None = None
     labels: dict[str, str] | None = None
 
-    @staticmethod
-    def _assert_all_gpu_or_none(strings: list[str] | None) -> bool:
-        if not strings:
-            return
-        all_gpu = all(s.startswith(("g", "p")) for s in strings)
-        none_gpu = all(not s.startswith(("g", "p")) for s in strings)
-        if not (all_gpu or none_gpu):
-            raise ValueError(
-                f"Mixing GPU and non-GPU specification for '{strings=}' is not allowed"
-            )
-
     def __post_init__(self):
+        _assert_literal("capacity_type", self.capacity_type, CapacityType)
+        if self.architecture is not None:
+            _assert_literal("architecture", self.architecture, Architecture)
+
         if (
             self.instance_type is None
             and self.instance_family is None
@@ -133,49 +195,39 @@ class NodePoolConfig:
                 "At least one of instance_type, instance_family, or instance_category must be provided"
             )
 
-        NodePoolConfig._assert_all_gpu_or_none(self.instance_type)
-        NodePoolConfig._assert_all_gpu_or_none(self.instance_family)
-        NodePoolConfig._assert_all_gpu_or_none(self.instance_category)
+        # Rejects GPU/non-GPU mixes, the result is re-derived by `gpu`
+        self._instance_specs_gpu()
+
+    def _instance_specs_gpu(self) -> bool:
+        return _classify_instance_specs(
+            _as_tuple(self.instance_type),
+            _as_tuple(self.instance_family),
+            _as_tuple(self.instance_category),
+        )
 
     @property
     def gpu(self) -> bool:
         """Whether the node pool is a GPU node pool."""
-        instance_specs = [
-            *(self.instance_type or []),
-            *(self.instance_family or []),
-            *(self.instance_category or []),
-        ]
-
-        try:
-            NodePoolConfig._assert_all_gpu_or_none(instance_specs)
-        except ValueError as e:
-            e.add_note(
-                "The mixing of instance type/family/category specifications is incorrect and yields a set of GPU and non-GPU instances, this is not allowed."
-            )
-            raise e
-
-        return all(s.startswith(("g", "p")) for s in instance_specs)
+        return self._instance_specs_gpu()
 
     @classmethod
     def from_dict(cls, data: dict) -> "NodePoolConfig":
         """Create a NodePoolConfig from a JSON/dict payload."""
-        taints = None
-
-        if data.get("taints"):
-            taints = [TaintConfig(**taint) for taint in data["taints"]]
-
-        return cls(
-            name=data["name"],
-            capacity_type=data["capacity_type"],
-            instance_type=data.get("instance_type", None),
-            instance_family=data.get("instance_family", None),
-            instance_category=data.get("instance_category", None),
-            ebs_size=data.get("ebs_size", DEFAULT_EBS_SIZE),
-            vcpu_limit=data.get("vcpu_limit", DEFAULT_VCPU_LIMIT),
-            memory_limit=data.get("memory_limit", DEFAULT_MEMORY_LIMIT),
-            taints=taints,
-            labels=data.get("labels"),
-        )
+        # Unknown keys are ignored, missing ones fall back to the field defaults
+        kwargs = {f.name: data[f.name] for f in fields(cls) if f.init and f.name in data}
+        if kwargs.get("taints"):
+            kwargs["taints"] = [
+                taint if isinstance(taint, TaintConfig) else TaintConfig(**taint)
+                for taint in kwargs["taints"]
+            ]
+        else:
+            kwargs["taints"] = None
+        return cls(**kwargs)
+
+
+def parse_node_pools(raw: typing.Iterable[dict]) -> list[NodePoolConfig]:
+    """Create NodePoolConfigs from a list of JSON/dict payloads, e.g. stack config."""
+    return [NodePoolConfig.from_dict(pool) for pool in raw]
 
 
 @dataclass
@@ -9,6 +9,7 @@ import pulumi_aws as aws
 import pulumi_kubernetes as k8s
 
 from . import config
+from .caller_identity import get_account_id
 from .irsa import IRSA
 
 if TYPE_CHECKING:
@@ -337,7 +338,7 @@ class KarpenterAddon(pulumi.ComponentResource):
         controller_inline_policy = pulumi.Output.all(
             cluster_name=self._cluster_name,
             region=aws.get_region(opts=invoke_opts).region,
-            account_id=aws.get_caller_identity(opts=invoke_opts).account_id,
+            account_id=get_account_id(self._aws_provider),
             karpenter_node_role_arn=self.karpenter_node_role.arn,
         ).apply(
             lambda a: pulumi.Output.json_dumps(
@@ -571,8 +572,8 @@ class KarpenterAddon(pulumi.ComponentResource):
         return cls(
             name=f"{cluster.name}-karpenter",
             cluster_name=cluster.k8s_name,
-            oidc_provider_arn=cluster.k8s.oidc_provider_arn,
-            oidc_issuer=cluster.k8s.oidc_issuer,
+            oidc_provider_arn=cluster.oidc_provider_arn,
+            oidc_issuer=cluster.oidc_issuer,
             node_security_group_id=cluster.node_security_group.id,
             subnet_ids=cluster.subnet_ids,
             node_pool_configs=cluster.node_pools,
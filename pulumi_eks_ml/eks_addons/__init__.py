@@ -20,6 +20,16 @@ __all__ = [
     "NvidiaDevicePluginAddon",
 ]
 
+_RECOMMENDED_ADDONS: tuple[type[EKSClusterAddon], ...] = (
+    EbsCsiAddon,
+    EFSCSIAddon,
+    AlbControllerAddon,
+    ExternalDNSAddon,
+    MetricsServerAddon,
+    FluentBitAddon,
+    NvidiaDevicePluginAddon,
+)
+
 
 def recommended_addons() -> list[type[EKSClusterAddon]]:
     """Get the recommended addons for an ML-ready EKS cluster.
@@ -33,12 +43,4 @@ def recommended_addons() -> list[type[EKSClusterAddon]]:
     - Fluent Bit
     - NVIDIA Device Plugin
     """
-    return [
-        EbsCsiAddon,
-        EFSCSIAddon,
-        AlbControllerAddon,
-        ExternalDNSAddon,
-        MetricsServerAddon,
-        FluentBitAddon,
-        NvidiaDevicePluginAddon,
-    ]
+    return list(_RECOMMENDED_ADDONS)
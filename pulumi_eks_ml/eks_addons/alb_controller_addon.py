@@ -1,3 +1,5 @@
+from typing import Sequence
+
 import pulumi
 import pulumi_aws as aws
 import pulumi_kubernetes as k8s
@@ -15,7 +17,7 @@ def install_aws_load_balancer_controller(
     vpc_id: pulumi.Input[str],
     k8s_provider: k8s.Provider,
     aws_provider: aws.Provider,
-    dependencies: list[pulumi.Resource],
+    dependencies: Sequence[pulumi.Resource],
     parent: pulumi.Resource,
     version: str,
 ) -> k8s.helm.v3.Release:
@@ -25,7 +27,7 @@ def install_aws_load_balancer_controller(
     opts = pulumi.ResourceOptions(
         parent=parent,
         providers={"kubernetes": k8s_provider, "aws": aws_provider},
-        depends_on=[*dependencies],
+        depends_on=dependencies,
     )
 
     # Create inline policy for ALB controller
@@ -300,7 +302,7 @@ def install_aws_load_balancer_controller(
         opts=pulumi.ResourceOptions(
             parent=parent,
             provider=k8s_provider,
-            depends_on=[*dependencies, alb_irsa.iam_role],
+            depends_on=(*dependencies, alb_irsa.iam_role),
         ),
     )
 
@@ -331,7 +333,7 @@ class AlbControllerAddon(pulumi.ComponentResource, EKSClusterAddon):
             vpc_id=vpc_id,
             k8s_provider=opts.providers["kubernetes"],
             aws_provider=opts.providers["aws"],
-            dependencies=opts.depends_on or [],
+            dependencies=opts.depends_on or (),
             parent=self,
             version=version,
         )
@@ -350,8 +352,8 @@ class AlbControllerAddon(pulumi.ComponentResource, EKSClusterAddon):
         return cls(
             name=f"{cluster.name}-alb-controller",
             cluster_name=cluster.k8s.eks_cluster.name,
-            oidc_provider_arn=cluster.k8s.oidc_provider_arn,
-            oidc_issuer=cluster.k8s.oidc_issuer,
+            oidc_provider_arn=cluster.oidc_provider_arn,
+            oidc_issuer=cluster.oidc_issuer,
             vpc_id=cluster.vpc_id,
             version=version or config.ALB_CONTROLLER_VERSION,
             opts=pulumi.ResourceOptions(
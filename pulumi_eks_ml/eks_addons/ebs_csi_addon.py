@@ -1,3 +1,6 @@
+import json
+from typing import Sequence
+
 import pulumi
 import pulumi_aws as aws
 import pulumi_kubernetes as k8s
@@ -7,12 +10,42 @@ from ..eks import config
 from ..eks.irsa import IRSA
 
 
+_EBS_CSI_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Action": [
+                    "ec2:CreateSnapshot",
+                    "ec2:AttachVolume",
+                    "ec2:DetachVolume",
+                    "ec2:ModifyVolume",
+                    "ec2:DescribeAvailabilityZones",
+                    "ec2:DescribeInstances",
+                    "ec2:DescribeSnapshots",
+                    "ec2:DescribeTags",
+                    "ec2:DescribeVolumes",
+                    "ec2:DescribeVolumesModifications",
+                    "ec2:CreateTags",
+                    "ec2:CreateVolume",
+                    "ec2:DeleteVolume",
+                    "ec2:DeleteSnapshot",
+                ],
+                "Resource": "*",
+            }
+        ],
+    },
+    separators=(",", ":"),
+)
+
+
 def install_ebs_csi_driver(
     name: str,
     oidc_provider_arn: pulumi.Input[str],
     oidc_issuer: pulumi.Input[str],
     k8s_provider: k8s.Provider,
-    dependencies: list[pulumi.Resource],
+    dependencies: Sequence[pulumi.Resource],
     parent: pulumi.Resource,
     version: str,
 ) -> k8s.helm.v3.Release:
@@ -29,33 +62,7 @@ def install_ebs_csi_driver(
         inline_policies=[
             aws.iam.RoleInlinePolicyArgs(
                 name=f"{name}-ebs-csi-policy",
-                policy=pulumi.Output.json_dumps(
-                    {
-                        "Version": "2012-10-17",
-                        "Statement": [
-                            {
-                                "Effect": "Allow",
-                                "Action": [
-                                    "ec2:CreateSnapshot",
-                                    "ec2:AttachVolume",
-                                    "ec2:DetachVolume",
-                                    "ec2:ModifyVolume",
-                                    "ec2:DescribeAvailabilityZones",
-                                    "ec2:DescribeInstances",
-                                    "ec2:DescribeSnapshots",
-                                    "ec2:DescribeTags",
-                                    "ec2:DescribeVolumes",
-                                    "ec2:DescribeVolumesModifications",
-                                    "ec2:CreateTags",
-                                    "ec2:CreateVolume",
-                                    "ec2:DeleteVolume",
-                                    "ec2:DeleteSnapshot",
-                                ],
-                                "Resource": "*",
-                            }
-                        ],
-                    }
-                ),
+                policy=_EBS_CSI_POLICY,
             )
         ],
         opts=pulumi.ResourceOptions(parent=parent),
@@ -84,7 +91,7 @@ def install_ebs_csi_driver(
         opts=pulumi.ResourceOptions(
             parent=parent,
             provider=k8s_provider,
-            depends_on=[*dependencies, ebs_csi_irsa.iam_role],
+            depends_on=(*dependencies, ebs_csi_irsa.iam_role),
         ),
     )
 
@@ -141,7 +148,7 @@ class EbsCsiAddon(pulumi.ComponentResource, EKSClusterAddon):
             oidc_provider_arn=oidc_provider_arn,
             oidc_issuer=oidc_issuer,
             k8s_provider=opts.providers["kubernetes"],
-            dependencies=opts.depends_on or [],
+            dependencies=opts.depends_on or (),
             parent=self,
             version=version,
         )
@@ -171,8 +178,8 @@ class EbsCsiAddon(pulumi.ComponentResource, EKSClusterAddon):
         """Create an EbsCsiAddon from an EKSCluster instance."""
         return cls(
             name=f"{cluster.name}-ebs-csi",
-            oidc_provider_arn=cluster.k8s.oidc_provider_arn,
-            oidc_issuer=cluster.k8s.oidc_issuer,
+            oidc_provider_arn=cluster.oidc_provider_arn,
+            oidc_issuer=cluster.oidc_issuer,
             version=version or config.EBS_CSI_VERSION,
             opts=pulumi.ResourceOptions(
                 parent=parent,
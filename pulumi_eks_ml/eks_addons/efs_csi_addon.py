@@ -14,7 +14,7 @@ def install_efs_csi_driver(
     oidc_provider_arn: pulumi.Input[str],
     oidc_issuer: pulumi.Input[str],
     k8s_provider: k8s.Provider,
-    dependencies: list[pulumi.Resource],
+    dependencies: Sequence[pulumi.Resource],
     parent: pulumi.Resource,
     version: str,
 ) -> k8s.helm.v3.Release:
@@ -57,7 +57,7 @@ def install_efs_csi_driver(
         opts=pulumi.ResourceOptions(
             parent=parent,
             provider=k8s_provider,
-            depends_on=[*dependencies, efs_csi_irsa.iam_role],
+            depends_on=(*dependencies, efs_csi_irsa.iam_role),
         ),
     )
 
@@ -69,7 +69,7 @@ def create_default_efs_fs_and_sc(
     aws_provider: aws.Provider,
     k8s_provider: k8s.Provider,
     parent: pulumi.Resource,
-    dependencies: list[pulumi.Resource],
+    dependencies: Sequence[pulumi.Resource],
 ) -> tuple[aws.efs.FileSystem, k8s.storage.v1.StorageClass]:
     """Create default EFS FileSystem and StorageClass. The default storage class can be used for dynamic provisioning of PVs."""
     aws_opts = pulumi.ResourceOptions(
@@ -102,6 +102,9 @@ def create_default_efs_fs_and_sc(
             )
         return mount_targets
 
+    # Mount target names embed the resolved subnet ids, so they can only be
+    # registered once those resolve. Registration merely queues the resources,
+    # the engine still creates every mount target concurrently.
     pulumi.Output.all(
         subnet_ids=subnet_ids, node_security_group_id=node_security_group_id
     ).apply(lambda kwargs: create_mount_targets(**kwargs))
@@ -125,7 +128,7 @@ def create_default_efs_fs_and_sc(
         opts=pulumi.ResourceOptions(
             parent=parent,
             provider=k8s_provider,
-            depends_on=[efs_fs, *dependencies],
+            depends_on=(efs_fs, *dependencies),
         ),
     )
     return efs_fs, efs_sc
@@ -157,7 +160,7 @@ class EFSCSIAddon(pulumi.ComponentResource, EKSClusterAddon):
             oidc_provider_arn=oidc_provider_arn,
             oidc_issuer=oidc_issuer,
             k8s_provider=opts.providers["kubernetes"],
-            dependencies=opts.depends_on or [],
+            dependencies=opts.depends_on or (),
             parent=self,
             version=version,
         )
@@ -169,7 +172,7 @@ class EFSCSIAddon(pulumi.ComponentResource, EKSClusterAddon):
             aws_provider=opts.providers["aws"],
             k8s_provider=opts.providers["kubernetes"],
             parent=self,
-            dependencies=opts.depends_on or [],
+            dependencies=opts.depends_on or (),
         )
 
         self.register_outputs(
@@ -191,8 +194,8 @@ class EFSCSIAddon(pulumi.ComponentResource, EKSClusterAddon):
         """Create an EFSCSIAddon from an EKSCluster instance."""
         return cls(
             name=f"{cluster.name}-efs-csi",
-            oidc_provider_arn=cluster.k8s.oidc_provider_arn,
-            oidc_issuer=cluster.k8s.oidc_issuer,
+            oidc_provider_arn=cluster.oidc_provider_arn,
+            oidc_issuer=cluster.oidc_issuer,
             subnet_ids=cluster.subnet_ids,
             node_security_group_id=cluster.node_security_group_id,
             version=version or config.EFS_CSI_VERSION,
@@ -1,3 +1,6 @@
+import json
+from typing import Sequence
+
 import pulumi
 import pulumi_aws as aws
 import pulumi_kubernetes as k8s
@@ -7,6 +10,31 @@ from ..eks.cluster import EKSCluster, EKSClusterAddon
 from ..eks.irsa import IRSA
 
 
+_EXTERNAL_DNS_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Action": ["route53:ChangeResourceRecordSets"],
+                "Resource": "arn:aws:route53:::hostedzone/*",
+            },
+            {
+                "Effect": "Allow",
+                "Action": [
+                    "route53:ListHostedZones",
+                    "route53:ListResourceRecordSets",
+                    "route53:ListHostedZonesByName",
+                    "route53:GetChange",
+                ],
+                "Resource": "*",
+            },
+        ],
+    },
+    separators=(",", ":"),
+)
+
+
 def create_external_dns(
     name: str,
     cluster_name: pulumi.Input[str],
@@ -14,7 +42,7 @@ def create_external_dns(
     oidc_issuer: pulumi.Input[str],
     k8s_provider: k8s.Provider,
     aws_provider: aws.Provider,
-    depends_on: list[pulumi.Resource],
+    depends_on: Sequence[pulumi.Resource],
     parent: pulumi.Resource,
     version: str,
 ) -> k8s.helm.v3.Release:
@@ -31,28 +59,7 @@ def create_external_dns(
         inline_policies=[
             aws.iam.RoleInlinePolicyArgs(
                 name=f"{name}-external-dns-policy",
-                policy=pulumi.Output.json_dumps(
-                    {
-                        "Version": "2012-10-17",
-                        "Statement": [
-                            {
-                                "Effect": "Allow",
-                                "Action": ["route53:ChangeResourceRecordSets"],
-                                "Resource": "arn:aws:route53:::hostedzone/*",
-                            },
-                            {
-                                "Effect": "Allow",
-                                "Action": [
-                                    "route53:ListHostedZones",
-                                    "route53:ListResourceRecordSets",
-                                    "route53:ListHostedZonesByName",
-                                    "route53:GetChange",
-                                ],
-                                "Resource": "*",
-                            },
-                        ],
-                    }
-                ),
+                policy=_EXTERNAL_DNS_POLICY,
             )
         ],
         opts=pulumi.ResourceOptions(
@@ -88,7 +95,7 @@ def create_external_dns(
         opts=pulumi.ResourceOptions(
             parent=parent,
             provider=k8s_provider,
-            depends_on=[*depends_on, irsa.iam_role],
+            depends_on=(*depends_on, irsa.iam_role),
         ),
     )
 
@@ -117,7 +124,7 @@ class ExternalDNSAddon(pulumi.ComponentResource, EKSClusterAddon):
             oidc_issuer=oidc_issuer,
             k8s_provider=opts.providers["kubernetes"],
             aws_provider=opts.providers["aws"],
-            depends_on=opts.depends_on or [],
+            depends_on=opts.depends_on or (),
             parent=self,
             version=version,
         )
@@ -136,8 +143,8 @@ class ExternalDNSAddon(pulumi.ComponentResource, EKSClusterAddon):
         return cls(
             name=f"{cluster.name}-external-dns",
             cluster_name=cluster.k8s.eks_cluster.name,
-            oidc_provider_arn=cluster.k8s.oidc_provider_arn,
-            oidc_issuer=cluster.k8s.oidc_issuer,
+            oidc_provider_arn=cluster.oidc_provider_arn,
+            oidc_issuer=cluster.oidc_issuer,
             version=version or config.EXTERNAL_DNS_VERSION,
             opts=pulumi.ResourceOptions(
                 parent=parent,
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 import pulumi
 import pulumi_aws as aws
 import pulumi_kubernetes as k8s
@@ -13,7 +15,7 @@ def install_aws_for_fluent_bit(
     oidc_issuer: pulumi.Input[str],
     k8s_provider: k8s.Provider,
     log_group_name: str,
-    dependencies: list[pulumi.Resource],
+    dependencies: Sequence[pulumi.Resource],
     parent: pulumi.Resource,
     version: str,
 ) -> k8s.helm.v3.Release:
@@ -125,7 +127,7 @@ def install_aws_for_fluent_bit(
         opts=pulumi.ResourceOptions(
             parent=parent,
             provider=k8s_provider,
-            depends_on=[*dependencies, fluent_bit_irsa.iam_role],
+            depends_on=(*dependencies, fluent_bit_irsa.iam_role),
         ),
     )
 
@@ -153,7 +155,7 @@ class FluentBitAddon(pulumi.ComponentResource, EKSClusterAddon):
             oidc_issuer=oidc_issuer,
             k8s_provider=opts.providers["kubernetes"],
             log_group_name=log_group_name,
-            dependencies=opts.depends_on or [],
+            dependencies=opts.depends_on or (),
             parent=self,
             version=version,
         )
@@ -174,8 +176,8 @@ class FluentBitAddon(pulumi.ComponentResource, EKSClusterAddon):
         log_group_name = f"{log_group_prefix}/{cluster.k8s_name}"
         return cls(
             name=f"{cluster.name}-fluent-bit",
-            oidc_provider_arn=cluster.k8s.oidc_provider_arn,
-            oidc_issuer=cluster.k8s.oidc_issuer,
+            oidc_provider_arn=cluster.oidc_provider_arn,
+            oidc_issuer=cluster.oidc_issuer,
             log_group_name=log_group_name,
             version=version or config.FLUENT_BIT_VERSION,
             opts=pulumi.ResourceOptions(
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 import pulumi
 import pulumi_kubernetes as k8s
 
@@ -9,7 +11,7 @@ def create_metrics_server(
     name: str,
     k8s_provider: k8s.Provider,
     parent: pulumi.Resource,
-    depends_on: list[pulumi.Resource],
+    depends_on: Sequence[pulumi.Resource],
     version: str,
 ) -> k8s.helm.v3.Release:
     """Create metrics server Helm release."""
@@ -49,7 +51,7 @@ class MetricsServerAddon(pulumi.ComponentResource, EKSClusterAddon):
             name=name,
             k8s_provider=opts.providers["kubernetes"],
             parent=self,
-            depends_on=opts.depends_on or [],
+            depends_on=opts.depends_on or (),
             version=version,
         )
 
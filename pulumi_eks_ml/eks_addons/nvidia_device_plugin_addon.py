@@ -1,3 +1,5 @@
+from typing import Sequence
+
 import pulumi
 import pulumi_kubernetes as k8s
 
@@ -9,7 +11,7 @@ def create_nvidia_device_plugin(
     name: str,
     k8s_provider: k8s.Provider,
     parent: pulumi.Resource,
-    depends_on: list[pulumi.Resource],
+    depends_on: Sequence[pulumi.Resource],
     version: str,
     custom_tolerations: list[dict] | None = None,
 ) -> k8s.helm.v3.Release:
@@ -82,7 +84,7 @@ class NvidiaDevicePluginAddon(pulumi.ComponentResource, EKSClusterAddon):
             name=name,
             k8s_provider=opts.providers["kubernetes"],
             parent=self,
-            depends_on=opts.depends_on or [],
+            depends_on=opts.depends_on or (),
             custom_tolerations=custom_tolerations,
             version=version,
         )
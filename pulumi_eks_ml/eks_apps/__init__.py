@@ -1,10 +1,40 @@
 """EKS applications."""
 
-from .skypilot import SkyPilotAPIServer, SkyPilotDataPlaneProvisioner
-from .tailscale_subnet_router import TailscaleSubnetRouter
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .skypilot import SkyPilotAPIServer, SkyPilotDataPlaneProvisioner
+    from .tailscale_subnet_router import TailscaleSubnetRouter
 
 __all__ = [
     "SkyPilotAPIServer",
     "SkyPilotDataPlaneProvisioner",
     "TailscaleSubnetRouter",
 ]
+
+# Each application brings its own dependencies (SkyPilot pulls in
+# pulumi_random and PyYAML), so they are only imported on first
+# access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "SkyPilotAPIServer": ".skypilot",
+    "SkyPilotDataPlaneProvisioner": ".skypilot",
+    "TailscaleSubnetRouter": ".tailscale_subnet_router",
+}
+_LAZY_SUBMODULES = {"skypilot", "tailscale_subnet_router"}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_LAZY_SUBMODULES})
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-from textwrap import dedent
 from typing import ClassVar, Mapping
 
 import pulumi
@@ -11,26 +11,32 @@ import pulumi_aws as aws
 import pulumi_kubernetes as k8s
 import pulumi_random as random
 import yaml
-from passlib.hash import apr_md5_crypt
 
 from ...eks.cluster import EKSCluster
 from ...eks.config import EFS_CSI_DEFAULT_SC_NAME, SKYPILOT_API_SERVER_VERSION
 from ...eks.irsa import IRSA
 
+# libyaml's emitter when PyYAML was built against it, the pure-Python one otherwise
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 # ----------------------------------------------------------------------
 # Config Helpers
 # ----------------------------------------------------------------------
 
+_AWS_CREDENTIALS_TEMPLATE = (
+    "\n"
+    "[default]\n"
+    "role_arn = {irsa_role_arn}\n"
+    "region = {cluster_region}\n"
+    "web_identity_token_file = /var/run/secrets/eks.amazonaws.com/serviceaccount/token\n"
+)
+
+
 def build_aws_credentials_secret(cluster_region: str, irsa_role_arn: str) -> str:
     """Build the AWS credentials file content for IRSA."""
-    return dedent(
-        f"""
-        [default]
-        role_arn = {irsa_role_arn}
-        region = {cluster_region}
-        web_identity_token_file = /var/run/secrets/eks.amazonaws.com/serviceaccount/token
-        """
+    return _AWS_CREDENTIALS_TEMPLATE.format(
+        cluster_region=cluster_region, irsa_role_arn=irsa_role_arn
     )
 
 
@@ -39,11 +45,11 @@ def build_api_service_config(
     default_user_role: str,
 ) -> str:
     """Build the SkyPilot API service YAML config payload."""
-    return yaml.safe_dump(
+    return yaml.dump(
         {
             "allowed_clouds": ["aws", "kubernetes"],
             "kubernetes": {
-                "allowed_contexts": list(service_accounts_by_context.keys()),
+                "allowed_contexts": list(service_accounts_by_context),
                 "context_configs": {
                     k: {"remote_identity": v}
                     for k, v in service_accounts_by_context.items()
@@ -54,7 +60,8 @@ def build_api_service_config(
             },
             "jobs": {"controller": {"consolidation_mode": True}},
             "rbac": {"default_role": default_user_role},
-        }
+        },
+        Dumper=_YAML_DUMPER,
     )
 
 
@@ -245,10 +252,65 @@ def build_api_service_policy(account_id: str) -> dict:
     }
 
 
+# Only the account ID varies, so the policy is serialized once and the ID
+# substituted into the resulting JSON text.
+_ACCOUNT_ID_PLACEHOLDER = "__ACCOUNT_ID__"
+_API_SERVICE_POLICY_TEMPLATE = json.dumps(
+    build_api_service_policy(_ACCOUNT_ID_PLACEHOLDER), separators=(",", ":")
+)
+
+
+def _api_service_policy_json(account_id: str) -> str:
+    return _API_SERVICE_POLICY_TEMPLATE.replace(_ACCOUNT_ID_PLACEHOLDER, account_id)
+
+
 # ----------------------------------------------------------------------
 # Credentials
 # ----------------------------------------------------------------------
 
+_APR1_MAGIC = b"$apr1$"
+_CRYPT_ALPHABET = "./0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+# Digest byte triplets in the order md5-crypt encodes them, the last byte is alone
+_APR1_ENCODING_ORDER = ((0, 6, 12), (1, 7, 13), (2, 8, 14), (3, 9, 15), (4, 10, 5))
+
+
+def _apr1_hash(password: str, salt: str) -> str:
+    """Hash a password with Apache's MD5-crypt variant, as used by htpasswd.
+
+    Produces the same `$apr1$<salt>$<hash>` string as passlib's apr_md5_crypt.
+    """
+    pw = password.encode()
+    salt_bytes = salt.encode()[:8]
+
+    alternate = hashlib.md5(pw + salt_bytes + pw).digest()
+    ctx = hashlib.md5(pw + _APR1_MAGIC + salt_bytes)
+    for remaining in range(len(pw), 0, -16):
+        ctx.update(alternate[: min(16, remaining)])
+    length = len(pw)
+    while length:
+        ctx.update(b"\0" if length & 1 else pw[:1])
+        length >>= 1
+    digest = ctx.digest()
+
+    # 1000 rounds to slow down brute forcing, as mandated by the algorithm
+    for i in range(1000):
+        round_ctx = hashlib.md5(pw if i & 1 else digest)
+        if i % 3:
+            round_ctx.update(salt_bytes)
+        if i % 7:
+            round_ctx.update(pw)
+        round_ctx.update(digest if i & 1 else pw)
+        digest = round_ctx.digest()
+
+    encoded = []
+    for a, b, c in _APR1_ENCODING_ORDER:
+        value = digest[a] << 16 | digest[b] << 8 | digest[c]
+        encoded.extend(_CRYPT_ALPHABET[(value >> (6 * n)) & 0x3F] for n in range(4))
+    encoded.extend(_CRYPT_ALPHABET[(digest[11] >> (6 * n)) & 0x3F] for n in range(2))
+
+    return f"$apr1${salt_bytes.decode()}${''.join(encoded)}"
+
+
 class SkyPilotAdminCredentials(pulumi.ComponentResource):
     """Creates admin credentials and secrets for SkyPilot API server."""
 
@@ -269,7 +331,9 @@ class SkyPilotAdminCredentials(pulumi.ComponentResource):
 
         web_username = "skypilot"
 
-        random_opts = pulumi.ResourceOptions(parent=self, depends_on=depends_on)
+        # The random values are generated locally, only the k8s secret needs the
+        # caller's dependencies (e.g. the namespace)
+        random_opts = pulumi.ResourceOptions(parent=self)
         web_password = random.RandomPassword(
             f"{name}-admin-pw",
             length=16,
@@ -285,9 +349,7 @@ class SkyPilotAdminCredentials(pulumi.ComponentResource):
 
         # Build stable htpasswd line using a deterministic salt
         auth_value = pulumi.Output.all(web_password.result, salt.result).apply(
-            lambda args: (
-                f"{web_username}:{apr_md5_crypt.using(salt=args[1]).hash(args[0])}"
-            )
+            lambda args: f"{web_username}:{_apr1_hash(args[0], args[1])}"
         )
 
         _ = k8s.core.v1.Secret(
@@ -313,11 +375,11 @@ class SkyPilotAdminCredentials(pulumi.ComponentResource):
         _ = aws.secretsmanager.SecretVersion(
             f"{name}-admin-secret-version",
             secret_id=admin_secret.id,
-            secret_string=pulumi.Output.all(web_password.result).apply(
-                lambda args: json.dumps(
+            secret_string=web_password.result.apply(
+                lambda password: json.dumps(
                     {
                         "username": web_username,
-                        "password": args[0],
+                        "password": password,
                     }
                 )
             ),
@@ -395,8 +457,12 @@ class SkyPilotAPIServer(pulumi.ComponentResource):
     - Generates initial Basic Auth credentials and enables user management
     - Stores credentials in AWS Secrets Manager
     - Exposes `admin_username`, `admin_password`, and `admin_secret_arn` outputs
+    - Exposes the Helm `release`, resources that only need the chart installed
+      should depend on it rather than on the whole component, which also waits
+      on the IAM and Secrets Manager children
     """
 
+    release: k8s.helm.v3.Release
     admin_username: pulumi.Output[str]
     admin_password: pulumi.Output[str]
     admin_secret_arn: pulumi.Output[str]
@@ -439,6 +505,10 @@ class SkyPilotAPIServer(pulumi.ComponentResource):
         namespace_res = k8s.core.v1.Namespace(
             f"{name}-ns", metadata={"name": namespace}, opts=k8s_opts
         )
+        # Options for the Kubernetes resources created inside the namespace
+        namespaced_k8s_opts = k8s_opts.merge(
+            pulumi.ResourceOptions(depends_on=[namespace_res])
+        )
 
         # ----------------------------------------------------------------------
         # SkyPilot Admin Credentials
@@ -460,16 +530,13 @@ class SkyPilotAPIServer(pulumi.ComponentResource):
             },
             string_data={"config": kubeconfig},
             type="Opaque",
-            opts=k8s_opts.merge(pulumi.ResourceOptions(depends_on=[namespace_res])),
+            opts=namespaced_k8s_opts,
         )
 
-        invoke_opts = pulumi.InvokeOptions(provider=cluster.aws_provider)
-        account_id = aws.get_caller_identity(opts=invoke_opts).account_id
-
         api_service_policy = aws.iam.Policy(
             f"{name}-api-service-policy",
             name=f"{cluster.name}-{namespace}-api-service-policy",
-            policy=pulumi.Output.json_dumps(build_api_service_policy(account_id)),
+            policy=_api_service_policy_json(cluster.account_id),
             opts=aws_opts,
         )
 
@@ -506,7 +573,7 @@ class SkyPilotAPIServer(pulumi.ComponentResource):
                 )
             },
             type="Opaque",
-            opts=k8s_opts.merge(pulumi.ResourceOptions(depends_on=[namespace_res])),
+            opts=namespaced_k8s_opts,
         )
 
         oauth_credentials = SkyPilotOAuthCredentials(
@@ -514,9 +581,7 @@ class SkyPilotAPIServer(pulumi.ComponentResource):
             namespace=namespace,
             client_id=oidc_client_id,
             client_secret=oidc_client_secret,
-            opts=k8s_opts.merge(
-                pulumi.ResourceOptions(parent=self, depends_on=[namespace_res])
-            ),
+            opts=namespaced_k8s_opts,
         )
 
         self.api_service_config = pulumi.Output.all(
@@ -528,12 +593,15 @@ class SkyPilotAPIServer(pulumi.ComponentResource):
             subnet_ids=cluster.subnet_ids,
             irsa_role_arn=api_service_irsa.iam_role_arn,
             api_service_config=self.api_service_config,
-            storage_class_name=EFS_CSI_DEFAULT_SC_NAME,
             ingress_host=ingress_host,
             ingress_ssl_cert_arn=ingress_ssl_cert_arn,
             oauth_issuer_url=oidc_issuer_url,
             oauth_client_secret_name=oauth_credentials.secret_name,
-        ).apply(lambda kwargs: build_values(**kwargs))
+        ).apply(
+            lambda kwargs: build_values(
+                storage_class_name=EFS_CSI_DEFAULT_SC_NAME, **kwargs
+            )
+        )
 
         # Install the Helm release
         release_name = f"{name}-sp-helm-release"
@@ -548,10 +616,9 @@ class SkyPilotAPIServer(pulumi.ComponentResource):
             namespace=namespace,
             values=values,
             skip_await=True,
-            opts=k8s_opts.merge(
+            opts=namespaced_k8s_opts.merge(
                 pulumi.ResourceOptions(
                     depends_on=[
-                        namespace_res,
                         kubeconfig_secret,
                         aws_credentials_secret,
                         oauth_credentials,
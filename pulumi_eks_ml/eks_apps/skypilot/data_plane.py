@@ -1,7 +1,6 @@
 """SkyPilot Data Plane resources."""
 
 import base64
-from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Mapping
 
@@ -16,6 +15,9 @@ _SP_SA = "sky-sa"
 _SP_USER_SA = "sky-user-sa"
 _SP_SYSTEM_NS = "skypilot-system"
 
+# Use libyaml's emitter when PyYAML was built against it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 # ----------------------------------------------------------------------
 # Data Plane User Identity
@@ -121,9 +123,9 @@ class SkyPilotDataPlaneUserIdentity(pulumi.ComponentResource):
             lambda metadata: metadata["name"]
         )
         # Context name matches the SkyPilotDataPlaneCredential convention: {cluster}-{namespace}
-        self.context_name = pulumi.Output.all(
-            self.cluster.cluster_name, namespace
-        ).apply(lambda values: f"{values[0]}-{values[1]}")
+        self.context_name = self.cluster.cluster_name.apply(
+            lambda cluster_name: f"{cluster_name}-{namespace}"
+        )
 
         self.register_outputs(
             {
@@ -164,6 +166,7 @@ class SkyPilotDataPlaneUserIdentityProvisioner(pulumi.ComponentResource):
     """
 
     service_accounts_by_context: pulumi.Output[Mapping[str, str]]
+    identities_details_all: pulumi.Output[list[dict]]
     identities: list[SkyPilotDataPlaneUserIdentity]
 
     def __init__(
@@ -183,9 +186,9 @@ class SkyPilotDataPlaneUserIdentityProvisioner(pulumi.ComponentResource):
             pulumi.ResourceOptions(parent=self)
         )
 
-        requests_by_cluster = defaultdict(list)
+        requests_by_cluster: dict[str, list[SkyPilotDataPlaneUserIdentityRequest]] = {}
         for request in identity_requests:
-            requests_by_cluster[request.cluster.name].append(request)
+            requests_by_cluster.setdefault(request.cluster.name, []).append(request)
 
         self.identities = []
         for cluster_name, requests in requests_by_cluster.items():
@@ -208,10 +211,14 @@ class SkyPilotDataPlaneUserIdentityProvisioner(pulumi.ComponentResource):
         self.service_accounts_by_context = pulumi.Output.all(*mappings).apply(
             lambda items: {context: name for context, name in items}
         )
+        self.identities_details_all = pulumi.Output.all(
+            *[identity.identity_details for identity in self.identities]
+        )
 
         self.register_outputs(
             {
                 "service_accounts_by_context": self.service_accounts_by_context,
+                "identities_details_all": self.identities_details_all,
             }
         )
 
@@ -230,7 +237,7 @@ class SkyPilotDataPlaneRequest:
     namespace: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkyPilotDataPlaneCredential:
     """A credential for a SkyPilot data plane."""
 
@@ -239,7 +246,7 @@ class SkyPilotDataPlaneCredential:
     namespace: str
     service_account: str
     ca_cert: str
-    token_b64: str
+    token: str
 
     @property
     def kubeconfig_context(self) -> str:
@@ -466,7 +473,9 @@ class SkyPilotDataPlane(pulumi.ComponentResource):
                 lambda metadata: metadata["name"]
             ),
             ca_cert=self.service_account_token.data["ca.crt"],
-            token_b64=self.service_account_token.data["token"],
+            token=self.service_account_token.data["token"].apply(
+                lambda token_b64: base64.b64decode(token_b64).decode("utf-8")
+            ),
         ).apply(lambda kwargs: SkyPilotDataPlaneCredential(**kwargs))
 
 
@@ -530,6 +539,9 @@ class SkyPilotFUSEDeviceManager(pulumi.ComponentResource):
             ),
         )
 
+        # Shared by every data plane's binding
+        role_name = self.role.metadata.apply(lambda metadata: metadata["name"])
+
         self.role_bindings = []
         for data_plane in data_planes:
             ns_name = data_plane.namespace.metadata.apply(
@@ -555,9 +567,7 @@ class SkyPilotFUSEDeviceManager(pulumi.ComponentResource):
                     ],
                     role_ref={
                         "kind": "Role",
-                        "name": self.role.metadata.apply(
-                            lambda metadata: metadata["name"]
-                        ),
+                        "name": role_name,
                         "apiGroup": "rbac.authorization.k8s.io",
                     },
                     opts=resource_opts.merge(
@@ -621,34 +631,35 @@ def _build_kubeconfig(credentials: list[SkyPilotDataPlaneCredential]) -> str:
     """Build a kubeconfig from a list of cluster entries."""
 
     clusters_by_name = {}
+    users = []
+    contexts = []
     for credential in credentials:
         clusters_by_name[credential.cluster_name] = {
             "certificate-authority-data": credential.ca_cert,
             "server": credential.cluster_endpoint,
         }
+        username = credential.username
+        users.append(
+            {
+                "name": username,
+                "user": {"token": credential.token},
+            }
+        )
+        contexts.append(
+            {
+                "name": credential.kubeconfig_context,
+                "context": {
+                    "cluster": credential.cluster_name,
+                    "user": username,
+                    "namespace": credential.namespace,
+                },
+            }
+        )
     clusters = [
         {"name": key, "cluster": value} for key, value in clusters_by_name.items()
     ]
-    users = [
-        {
-            "name": credential.username,
-            "user": {"token": base64.b64decode(credential.token_b64).decode("utf-8")},
-        }
-        for credential in credentials
-    ]
-    contexts = [
-        {
-            "name": credential.kubeconfig_context,
-            "context": {
-                "cluster": credential.cluster_name,
-                "user": credential.username,
-                "namespace": credential.namespace,
-            },
-        }
-        for credential in credentials
-    ]
 
-    return yaml.safe_dump(
+    return yaml.dump(
         {
             "apiVersion": "v1",
             "kind": "Config",
@@ -658,6 +669,7 @@ def _build_kubeconfig(credentials: list[SkyPilotDataPlaneCredential]) -> str:
             "clusters": clusters,
             "users": users,
         },
+        Dumper=_YAML_DUMPER,
         sort_keys=False,
     )
 
@@ -678,13 +690,13 @@ class SkyPilotDataPlaneProvisioner(pulumi.ComponentResource):
             "pulumi-eks-ml:eks:SkyPilotDataPlaneProvisioner", name, None, opts
         )
 
-        dp_requests_by_cluster = defaultdict(list)
+        dp_requests_by_cluster: dict[str, list[SkyPilotDataPlaneRequest]] = {}
+        for request in dp_requests:
+            dp_requests_by_cluster.setdefault(request.cluster.name, []).append(request)
+
         self._dp_groups: list[SkyPilotDataPlaneGroup] = []
         self._credentials: list[pulumi.Output[SkyPilotDataPlaneCredential]] = []
 
-        for request in dp_requests:
-            dp_requests_by_cluster[request.cluster.name].append(request)
-
         for cluster_name, requests in dp_requests_by_cluster.items():
             dp_group = SkyPilotDataPlaneGroup(
                 name=f"{name}-{cluster_name}",
@@ -694,10 +706,12 @@ class SkyPilotDataPlaneProvisioner(pulumi.ComponentResource):
             self._dp_groups.append(dp_group)
             self._credentials.extend([dp.credential for dp in dp_group.data_planes])
 
+        # Join the credentials once, both outputs are derived from the same list
+        credentials = pulumi.Output.all(*self._credentials)
         self.api_server_kube_config = pulumi.Output.secret(
-            pulumi.Output.all(*self._credentials).apply(_build_kubeconfig)
+            credentials.apply(_build_kubeconfig)
         )
-        self.api_server_kube_contexts = pulumi.Output.all(*self._credentials).apply(
+        self.api_server_kube_contexts = credentials.apply(
             lambda credentials: [
                 credential.kubeconfig_context for credential in credentials
             ]
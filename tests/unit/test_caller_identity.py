@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock, patch
+
+import pulumi
+import pulumi_aws as aws
+import pytest
+
+from pulumi_eks_ml.eks import caller_identity
+
+_ACCOUNT_ID = "123456789012"
+
+
+class CallerIdentityMocks(pulumi.runtime.Mocks):
+    def new_resource(self, args: pulumi.runtime.MockResourceArgs):
+        return f"{args.name}-id", dict(args.inputs)
+
+    def call(self, args: pulumi.runtime.MockCallArgs):
+        return {}
+
+
+@pytest.fixture
+def get_caller_identity():
+    # Other modules install their own mocks at import time, put them back after.
+    previous = pulumi.runtime.settings.get_monitor()
+    pulumi.runtime.set_mocks(CallerIdentityMocks())
+    caller_identity._default_account_id.cache_clear()
+    with patch.object(
+        caller_identity.aws,
+        "get_caller_identity",
+        return_value=MagicMock(account_id=_ACCOUNT_ID),
+    ) as mock:
+        yield mock
+    caller_identity._default_account_id.cache_clear()
+    if previous is not None:
+        pulumi.runtime.set_mocks(previous.mocks, monitor=previous)
+
+
+def test_get_account_id_invokes_once_per_provider(get_caller_identity):
+    first = aws.Provider("first", region="us-west-2")
+    second = aws.Provider("second", region="us-east-1")
+
+    assert caller_identity.get_account_id(first) == _ACCOUNT_ID
+    assert caller_identity.get_account_id(first) == _ACCOUNT_ID
+    assert caller_identity.get_account_id(second) == _ACCOUNT_ID
+
+    assert get_caller_identity.call_count == 2
+    assert first in caller_identity._ACCOUNT_IDS
+    assert second in caller_identity._ACCOUNT_IDS
+
+
+def test_get_account_id_memoizes_default_provider(get_caller_identity):
+    assert caller_identity.get_account_id(None) == _ACCOUNT_ID
+    assert caller_identity.get_account_id(None) == _ACCOUNT_ID
+
+    get_caller_identity.assert_called_once_with()
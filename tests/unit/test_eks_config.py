@@ -0,0 +1,128 @@
+import pytest
+
+from pulumi_eks_ml.eks.config import NodePoolConfig, TaintConfig, parse_node_pools
+
+
+def _pool_payload() -> dict:
+    return {
+        "name": "gpu",
+        "capacity_type": "spot",
+        "instance_family": ["g5"],
+        "taints": [{"key": "nvidia.com/gpu", "value": "true", "effect": "NoSchedule"}],
+        "labels": {"team": "ml"},
+    }
+
+
+def test_node_pool_from_dict_parses_payload():
+    pool = NodePoolConfig.from_dict(_pool_payload())
+
+    assert pool.name == "gpu"
+    assert pool.instance_family == ["g5"]
+    assert pool.taints == [
+        TaintConfig(key="nvidia.com/gpu", value="true", effect="NoSchedule")
+    ]
+    assert pool.gpu
+
+
+def test_node_pool_from_dict_returns_independent_instances():
+    payload = _pool_payload()
+    reordered = dict(reversed(list(payload.items())))
+
+    first = NodePoolConfig.from_dict(payload)
+    second = NodePoolConfig.from_dict(reordered)
+    assert first == second
+
+    first.labels["team"] = "other"
+    first.taints.append(TaintConfig(key="dedicated", effect="NoExecute"))
+    assert NodePoolConfig.from_dict(payload) == second
+
+
+def test_node_pool_from_dict_accepts_taint_configs():
+    taint = TaintConfig(key="nvidia.com/gpu", value="true", effect="NoSchedule")
+    payload = {**_pool_payload(), "taints": [taint]}
+
+    assert NodePoolConfig.from_dict(payload).taints == [taint]
+
+
+def test_parse_node_pools_keeps_order():
+    pools = parse_node_pools(
+        [
+            {"name": "general", "capacity_type": "on-demand", "instance_category": ["t"]},
+            _pool_payload(),
+        ]
+    )
+
+    assert [pool.name for pool in pools] == ["general", "gpu"]
+    assert [pool.gpu for pool in pools] == [False, True]
+
+
+def test_node_pool_and_taint_configs_are_slotted():
+    pool = NodePoolConfig.from_dict(_pool_payload())
+
+    assert not hasattr(pool, "__dict__")
+    assert not hasattr(pool.taints[0], "__dict__")
+
+
+def test_node_pool_rejects_mixed_gpu_specs_at_construction():
+    with pytest.raises(ValueError, match="Mixing GPU and non-GPU"):
+        NodePoolConfig(
+            name="mixed",
+            capacity_type="spot",
+            instance_family=["g5"],
+            instance_category=["t"],
+        )
+
+
+@pytest.mark.parametrize(
+    ("payload_update", "message"),
+    [
+        ({"capacity_type": "reserved"}, "Invalid capacity_type"),
+        ({"architecture": "x86"}, "Invalid architecture"),
+        ({"taints": [{"key": "gpu", "effect": "NoScheduled"}]}, "Invalid taint effect"),
+    ],
+)
+def test_node_pool_rejects_unknown_literals(payload_update, message):
+    with pytest.raises(ValueError, match=message):
+        NodePoolConfig.from_dict({**_pool_payload(), **payload_update})
+
+
+def test_taint_to_toleration():
+    taint = TaintConfig(key="nvidia.com/gpu", value="true")
+
+    assert taint.to_toleration() == {
+        "key": "nvidia.com/gpu",
+        "operator": "Equal",
+        "effect": "NoSchedule",
+        "value": "true",
+    }
+    assert taint.to_toleration("Exists") == {
+        "key": "nvidia.com/gpu",
+        "operator": "Exists",
+        "effect": "NoSchedule",
+    }
+
+
+def test_node_pool_from_dict_defaults_and_ignores_unknown_keys():
+    pool = NodePoolConfig.from_dict(
+        {
+            "name": "general",
+            "capacity_type": "on-demand",
+            "instance_category": ["m"],
+            "taints": [],
+            "unknown": "ignored",
+        }
+    )
+
+    assert pool == NodePoolConfig(
+        name="general", capacity_type="on-demand", instance_category=["m"]
+    )
+
+
+def test_node_pool_gpu_follows_instance_spec_changes():
+    pool = NodePoolConfig(
+        name="general", capacity_type="on-demand", instance_category=["t"]
+    )
+    assert not pool.gpu
+
+    pool.instance_category = ["g"]
+    assert pool.gpu
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+import yaml
+
+from pulumi_eks_ml.eks_apps.skypilot.api_server import (
+    _api_service_policy_json,
+    _apr1_hash,
+    build_api_service_config,
+    build_api_service_policy,
+    build_aws_credentials_secret,
+)
+
+
+# Reference values produced by `htpasswd -m` / passlib's apr_md5_crypt
+@pytest.mark.parametrize(
+    ("password", "salt", "expected"),
+    [
+        ("", "abcdefgh", "$apr1$abcdefgh$L.PT565ESX4Tp2bqNs7Ie."),
+        ("myPassword", "rOk3Ztbg", "$apr1$rOk3Ztbg$u5W2C3m7zopF0TM2dV6qv0"),
+        ("x" * 40, "Zz09./Ab", "$apr1$Zz09./Ab$SE67gVOCEtJudxnCXcth4/"),
+        ("pässwörd", "saltsalt", "$apr1$saltsalt$i5XfNxJNeh2E8ljXycZFm0"),
+    ],
+)
+def test_apr1_hash_matches_htpasswd(password, salt, expected):
+    assert _apr1_hash(password, salt) == expected
+
+
+def test_api_service_config_matches_safe_dump():
+    service_accounts_by_context = {
+        "hub-cluster-team-a": "skypilot-user",
+        "spoke-cluster-team-b": "skypilot-user",
+    }
+
+    config = build_api_service_config(service_accounts_by_context, "user")
+
+    assert config == yaml.safe_dump(yaml.safe_load(config))
+    assert yaml.safe_load(config)["kubernetes"]["context_configs"] == {
+        "hub-cluster-team-a": {"remote_identity": "skypilot-user"},
+        "spoke-cluster-team-b": {"remote_identity": "skypilot-user"},
+    }
+
+
+def test_api_service_policy_json_matches_policy_document():
+    account_id = "123456789012"
+
+    assert json.loads(_api_service_policy_json(account_id)) == (
+        build_api_service_policy(account_id)
+    )
+
+
+def test_aws_credentials_secret():
+    assert build_aws_credentials_secret(
+        "us-west-2", "arn:aws:iam::123456789012:role/api"
+    ) == (
+        "\n"
+        "[default]\n"
+        "role_arn = arn:aws:iam::123456789012:role/api\n"
+        "region = us-west-2\n"
+        "web_identity_token_file = "
+        "/var/run/secrets/eks.amazonaws.com/serviceaccount/token\n"
+    )
@@ -0,0 +1,50 @@
+import yaml
+
+from pulumi_eks_ml.eks_apps.skypilot.data_plane import (
+    SkyPilotDataPlaneCredential,
+    _build_kubeconfig,
+)
+
+
+def _credential(cluster_name: str, namespace: str) -> SkyPilotDataPlaneCredential:
+    return SkyPilotDataPlaneCredential(
+        cluster_name=cluster_name,
+        cluster_endpoint=f"https://{cluster_name}.example.com",
+        namespace=namespace,
+        service_account="sky-sa",
+        ca_cert="Y2EtY2VydA==",
+        token=f"{cluster_name}-{namespace}",
+    )
+
+
+def test_build_kubeconfig():
+    credentials = [
+        _credential("hub", "team-a"),
+        _credential("hub", "team-b"),
+        _credential("spoke", "team-a"),
+    ]
+
+    kubeconfig = yaml.safe_load(_build_kubeconfig(credentials))
+
+    assert kubeconfig["current-context"] == "hub-team-a"
+    assert [cluster["name"] for cluster in kubeconfig["clusters"]] == ["hub", "spoke"]
+    assert kubeconfig["users"][1] == {
+        "name": "hub-team-b-sky-sa",
+        "user": {"token": "hub-team-b"},
+    }
+    assert kubeconfig["contexts"][2] == {
+        "name": "spoke-team-a",
+        "context": {
+            "cluster": "spoke",
+            "user": "spoke-team-a-sky-sa",
+            "namespace": "team-a",
+        },
+    }
+
+
+def test_credential_has_no_instance_dict():
+    credential = _credential("hub", "team-a")
+
+    assert not hasattr(credential, "__dict__")
+    assert credential.kubeconfig_context == "hub-team-a"
+    assert credential.username == "hub-team-a-sky-sa"
@@ -0,0 +1,89 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+_CONFIG_PATH = (
+    Path(__file__).parents[2] / "projects" / "skypilot-multi-tenant" / "config.py"
+)
+
+
+@pytest.fixture(scope="module")
+def project_config():
+    spec = importlib.util.spec_from_file_location(
+        "skypilot_multi_tenant_config", _CONFIG_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    # pydantic resolves the postponed annotations through sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules[spec.name]
+
+
+def _region(region: str) -> dict:
+    return {
+        "region": region,
+        "node_pools": [
+            {"name": "general", "capacity_type": "on-demand", "instance_category": ["t"]}
+        ],
+        "skypilot": {
+            "ingress_host": "skypilot.example.com",
+            "ingress_ssl_cert_arn": "arn:aws:acm:us-east-1:123456789012:certificate/x",
+            "default_user_role": "user",
+            "data_planes": [{"name": "team-a"}],
+        },
+        "tailscale": {"oauth_secret_arn": "arn:aws:secretsmanager:us-east-1:1:secret:x"},
+    }
+
+
+def test_spoke_accepts_hub_schema(project_config):
+    config = project_config.ProjectConfig(
+        hub=_region("us-east-1"), spokes=[_region("us-west-2")]
+    )
+
+    spoke = config.spokes[0]
+    assert [dp.name for dp in spoke.skypilot.data_planes] == ["team-a"]
+    assert spoke.node_pools[0].name == "general"
+
+
+def test_spoke_rejects_misspelled_keys(project_config):
+    spoke = _region("us-west-2")
+    spoke["skypilto"] = spoke.pop("skypilot")
+
+    with pytest.raises(ValidationError, match="spokes.0.skypilto"):
+        project_config.ProjectConfig(hub=_region("us-east-1"), spokes=[spoke])
+
+
+def test_spoke_skypilot_rejects_misspelled_keys(project_config):
+    spoke = _region("us-west-2")
+    spoke["skypilot"]["data_plane"] = spoke["skypilot"].pop("data_planes")
+
+    with pytest.raises(ValidationError, match="spokes.0.skypilot.data_plane"):
+        project_config.ProjectConfig(hub=_region("us-east-1"), spokes=[spoke])
+
+
+def test_hub_skypilot_requires_api_server_keys(project_config):
+    hub = _region("us-east-1")
+    del hub["skypilot"]["ingress_host"]
+
+    with pytest.raises(ValidationError, match="hub.skypilot.ingress_host"):
+        project_config.ProjectConfig(hub=hub)
+
+
+def test_hub_skypilot_rejects_unknown_keys(project_config):
+    hub = _region("us-east-1")
+    hub["skypilot"]["unknown"] = True
+
+    with pytest.raises(ValidationError):
+        project_config.ProjectConfig(hub=hub)
+
+
+def test_invalid_node_pool_is_a_validation_error(project_config):
+    hub = _region("us-east-1")
+    del hub["node_pools"][0]["name"]
+
+    with pytest.raises(ValidationError, match="hub.node_pools"):
+        project_config.ProjectConfig(hub=hub)